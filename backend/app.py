@@ -1,6 +1,5 @@
 """Flask REST API for TumorBoard variant assessment."""
 
-import asyncio
 import logging
 import os
 from typing import Any
@@ -9,8 +8,9 @@ from asgiref.wsgi import WsgiToAsgi
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 
-from tumorboard.api.myvariant import MyVariantClient
+from tumorboard.api.myvariant import MyVariantClient, run_with_shared_client
 from tumorboard.engine import AssessmentEngine
+from tumorboard.models.assessment import ActionabilityAssessment
 from tumorboard.models.variant import VariantInput
 
 # Configure logging
@@ -28,8 +28,12 @@ CORS(flask_app, resources={r"/api/*": {"origins": "*"}})
 
 
 def get_engine() -> AssessmentEngine:
-    """Get or create AssessmentEngine instance."""
-    return AssessmentEngine()
+    """Get or create AssessmentEngine instance.
+
+    Each request runs on its own short-lived loop (see run_with_shared_client),
+    so the MyVariant pool is not warmed or kept alive.
+    """
+    return AssessmentEngine(warm_pool=False)
 
 
 @flask_app.route("/api/health", methods=["GET"])
@@ -75,8 +79,13 @@ def assess_variant() -> tuple[dict[str, Any], int]:
 
         # Run assessment
         logger.info(f"Assessing variant: {variant_input.gene} {variant_input.variant}")
-        engine = get_engine()
-        assessment = asyncio.run(engine.assess_variant(variant_input))
+
+        async def assess_async() -> ActionabilityAssessment:
+            """Assess inside the engine's context so its clients are closed."""
+            async with get_engine() as engine:
+                return await engine.assess_variant(variant_input)
+
+        assessment = run_with_shared_client(assess_async())
 
         # Convert to dict for JSON response
         response = {
@@ -153,12 +162,12 @@ def get_evidence(gene: str, variant: str) -> tuple[dict[str, Any], int]:
 
     async def fetch_evidence_async() -> Any:
         """Helper to run async code."""
-        async with MyVariantClient() as client:
+        async with MyVariantClient(warm_pool=False) as client:
             return await client.fetch_evidence(gene, variant)
 
     try:
         logger.info(f"Fetching evidence for: {gene} {variant}")
-        evidence = asyncio.run(fetch_evidence_async())
+        evidence = run_with_shared_client(fetch_evidence_async())
 
         # Convert Evidence model to dict
         response = {
@@ -1,5 +1,9 @@
 """API clients for external data sources."""
 
-from tumorboard.api.myvariant import MyVariantClient
+from tumorboard.api.myvariant import (
+    MyVariantClient,
+    run_with_shared_client,
+    shutdown_shared_client,
+)
 
-__all__ = ["MyVariantClient"]
+__all__ = ["MyVariantClient", "run_with_shared_client", "shutdown_shared_client"]
@@ -6,30 +6,446 @@ ARCHITECTURE:
 Aggregates variant information from multiple databases for LLM assessment.
 
 Key Design:
-- Async HTTP with connection pooling (httpx.AsyncClient)
-- Retry with exponential backoff (tenacity)
-- Structured parsing to typed Evidence models
-- Context manager for session cleanup
+- Async HTTP with connection pooling and HTTP/2 (httpx.AsyncClient)
+- Per-client semaphore caps in-flight requests so callers can gather freely
+- Retry with jittered exponential backoff on 429/5xx/network errors only
+- orjson response decoding, structured parsing to typed Evidence models
+- Schema-driven source parsers (field maps of path + converter) that build
+  evidence with model_construct() and skip per-item Pydantic validation
+- One client per event loop shared across instances (shutdown_shared_client),
+  warmed in the background on first context entry and kept alive with pings
+- Process-wide TTL/LRU evidence memoization with in-flight request coalescing
+- Persistent SQLite cache of raw query responses across restarts
 """
 
 import asyncio
-from typing import Any
+import functools
+import hashlib
+import random
+import weakref
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, TypeVar
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import orjson
+from pydantic import BaseModel
 
-from tumorboard.api.myvariant_models import MyVariantHit, MyVariantResponse
+from tumorboard.api.myvariant_models import MyVariantHit
 from tumorboard.models.evidence import (
     CIViCEvidence,
     ClinVarEvidence,
     COSMICEvidence,
     Evidence,
 )
+from tumorboard.utils.cache import SQLiteCache, TTLCache
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+# Fields requested from CIViC, ClinVar, COSMIC, and identifiers
+_EVIDENCE_FIELDS = (
+    "civic",
+    "clinvar",
+    "cosmic",
+    "dbsnp",
+    "cadd",
+    "entrezgene",  # NCBI Gene ID
+    "cosmic.cosmic_id",  # COSMIC mutation ID
+    "clinvar.variant_id",  # ClinVar variation ID
+    "clinvar.rcv",  # ClinVar RCV records (contains clinical_significance and accession)
+    "dbsnp.rsid",  # dbSNP rs number
+    "hgvs",  # HGVS notations (genomic, protein, transcript)
+    "snpeff",  # SnpEff effect prediction
+    "dbnsfp.polyphen2.hdiv.pred",  # PolyPhen2 prediction
+    "dbnsfp.cadd.phred",  # CADD phred score
+    "gnomad_exome.af.af",  # gnomAD exome allele frequency
+    "vcf.alt",  # VCF alternative allele
+    "vcf.ref",  # VCF reference allele
+)
+_EVIDENCE_FIELDS_CSV = ",".join(_EVIDENCE_FIELDS)
+
+
+@functools.lru_cache(maxsize=32)
+def _join_fields(fields: tuple[str, ...]) -> str:
+    """Join a custom field list into the comma-separated API parameter."""
+    return ",".join(fields)
+
+
+def _fields_param(fields: Sequence[str]) -> str:
+    """Get the comma-separated fields parameter, precomputed for the default list."""
+    if fields is _EVIDENCE_FIELDS:
+        return _EVIDENCE_FIELDS_CSV
+    return _join_fields(tuple(fields))
+
+
+# Per-event-loop state. httpx clients and asyncio tasks are bound to the loop
+# that created them, and several loops may run at once (the backend runs one
+# asyncio.run() per request thread), so each loop gets its own entries; they
+# are dropped when the loop is garbage collected.
+_LoopRegistry = weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[K, V]]
+
+# HTTP clients shared by every MyVariantClient on a loop, keyed by timeout
+_shared_clients: _LoopRegistry[float, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+# Background pings keeping each warmed shared client's connections alive
+_keepalive_tasks: _LoopRegistry[float, "asyncio.Task[None]"] = weakref.WeakKeyDictionary()
+
+# Warm-up/keepalive pings: short timeout, and an interval inside the pool's
+# keepalive_expiry so idle connections are not reaped between bursts
+PING_TIMEOUT = 5.0
+KEEPALIVE_INTERVAL = 20.0
+
+
+def _build_client(timeout: float, limits: httpx.Limits) -> httpx.AsyncClient:
+    """Create an HTTP client with pooled connections and HTTP/2 enabled.
+
+    Content-encoding negotiation is left to httpx, which advertises
+    every decoder it has installed (gzip/deflate, plus br/zstd when
+    the optional packages are present).
+    """
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=True)
+
+
+def _for_running_loop(registry: _LoopRegistry[K, V]) -> dict[K, V]:
+    """Get the running event loop's entries in a per-loop registry."""
+    return registry.setdefault(asyncio.get_running_loop(), {})
+
+
+def _get_shared_client(timeout: float, limits: httpx.Limits) -> httpx.AsyncClient:
+    """Get or lazily create the shared HTTP client for the running loop.
+
+    Creation is synchronous, so concurrent callers on the same loop cannot
+    race between the lookup and the insert.
+    """
+    clients = _for_running_loop(_shared_clients)
+    client = clients.get(timeout)
+    if client is None or client.is_closed:
+        client = _build_client(timeout, limits)
+        clients[timeout] = client
+        stale_task = _for_running_loop(_keepalive_tasks).pop(timeout, None)
+        if stale_task is not None:
+            stale_task.cancel()
+    return client
+
+
+async def _ping(client: httpx.AsyncClient, base_url: str) -> None:
+    """Issue a cheap request to open or refresh pooled connections."""
+    try:
+        await client.get(f"{base_url}/metadata", timeout=PING_TIMEOUT)
+    except httpx.HTTPError:
+        pass
+
+
+async def _keepalive(client: httpx.AsyncClient, base_url: str) -> None:
+    """Warm the pool, then ping periodically so idle pooled connections stay open."""
+    while not client.is_closed:
+        await _ping(client, base_url)
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+
+
+def _warm_shared_client(timeout: float, limits: httpx.Limits, base_url: str) -> httpx.AsyncClient:
+    """Get the shared HTTP client, starting its warm-up on first use.
+
+    The first caller starts a background task that opens a connection and
+    then keeps the pool alive; nobody waits on it, so a lookup issued right
+    away runs alongside the warm-up instead of behind it.
+    """
+    client = _get_shared_client(timeout, limits)
+    keepalive_tasks = _for_running_loop(_keepalive_tasks)
+    if timeout not in keepalive_tasks:
+        keepalive_tasks[timeout] = asyncio.create_task(_keepalive(client, base_url))
+    return client
+
+
+async def shutdown_shared_client() -> None:
+    """Close the running loop's shared HTTP clients.
+
+    Call once on application shutdown, from the loop that used them; clients
+    owned by other running loops are left alone.
+    """
+    loop = asyncio.get_running_loop()
+
+    tasks = list(_keepalive_tasks.pop(loop, {}).values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    clients = list(_shared_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+def run_with_shared_client(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine with asyncio.run(), then close that loop's shared HTTP clients.
+
+    Shared clients belong to one event loop, so they are reused only by the
+    lookups made inside coro; each call sets up (and tears down) its own pool.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await shutdown_shared_client()
+
+    return asyncio.run(main())
+
+
+def _as_list(value: Any) -> list[Any]:
+    """Wrap a single API value in a list; MyVariant returns either shape."""
+    return value if isinstance(value, list) else [value]
+
+
+# Schema-driven extraction of evidence items. Each field map entry is
+# (model field, dotted path into the raw item, optional converter); paths
+# are split into key tuples once at import so parsing only does dict lookups.
+# Items are built with model_construct(), so converters must enforce the
+# model's declared field types.
+_FieldMap = tuple[tuple[str, tuple[str, ...], Callable[[Any], Any] | None], ...]
+
+
+def _compile_field_map(
+    entries: list[tuple[str, str, Callable[[Any], Any] | None]],
+) -> _FieldMap:
+    """Precompute the key tuple for each dotted path in a field map."""
+    return tuple((field, tuple(path.split(".")), convert) for field, path, convert in entries)
+
+
+def _extract(item: dict[str, Any], path: tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts, returning None if it breaks."""
+    value: Any = item
+    for key in path:
+        if type(value) is not dict:
+            return None
+        value = value.get(key)
+    return value
+
+
+def _parse_items(data: Any, model_cls: type[ModelT], field_map: _FieldMap) -> list[ModelT]:
+    """Build one model per dict item in data (a dict or list) using a field map."""
+    evidence_list: list[ModelT] = []
+    for item in _as_list(data):
+        if type(item) is not dict:
+            continue
+        values = {}
+        for field, path, convert in field_map:
+            value = _extract(item, path)
+            values[field] = convert(value) if convert is not None else value
+        evidence_list.append(model_cls.model_construct(**values))
+    return evidence_list
+
+
+def _str_or_none(value: Any) -> str | None:
+    """Stringify scalar values (identifiers may arrive as ints), dropping anything else."""
+    return str(value) if isinstance(value, (str, int, float)) else None
+
+
+def _int_or_none(value: Any) -> int | None:
+    """Convert integer-like values (e.g. numeric strings), dropping anything else."""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _str_list(value: Any) -> list[str]:
+    """Keep the string and integer entries of a list as strings."""
+    if type(value) is not list:
+        return []
+    return [str(v) for v in value if isinstance(v, (str, int))]
+
+
+def _drug_names(value: Any) -> list[str]:
+    """Collect drug names from a list of CIViC drug objects."""
+    if type(value) is not list:
+        return []
+    return _str_list([drug.get("name", "") for drug in value if type(drug) is dict])
+
+
+def _clinical_significance(value: Any) -> str | None:
+    """Join multi-valued ClinVar significance into one string."""
+    if type(value) is list:
+        value = ", ".join(str(s) for s in value)
+    return str(value) if value else None
+
+
+def _condition_names(value: Any) -> list[str]:
+    """Normalize ClinVar conditions (object, list of objects, or strings) to names."""
+    if type(value) is dict:
+        return _str_list([value.get("name", "")])
+    if type(value) is not list:
+        return []
+    return _str_list([cond.get("name", "") if type(cond) is dict else cond for cond in value])
+
+
+# CIViC entries nested under "evidence_items" carry disease/source/drugs as objects
+_CIVIC_EVIDENCE_ITEM_FIELDS = _compile_field_map(
+    [
+        ("evidence_type", "evidence_type", _str_or_none),
+        ("evidence_level", "evidence_level", _str_or_none),
+        ("evidence_direction", "evidence_direction", _str_or_none),
+        ("clinical_significance", "clinical_significance", _str_or_none),
+        ("disease", "disease.name", _str_or_none),
+        ("drugs", "drugs", _drug_names),
+        ("description", "description", _str_or_none),
+        ("source", "source.name", _str_or_none),
+        ("rating", "rating", _int_or_none),
+    ]
+)
+
+# Direct CIViC evidence objects carry them as plain values
+_CIVIC_DIRECT_FIELDS = _compile_field_map(
+    [
+        ("evidence_type", "evidence_type", _str_or_none),
+        ("evidence_level", "evidence_level", _str_or_none),
+        ("evidence_direction", "evidence_direction", _str_or_none),
+        ("clinical_significance", "clinical_significance", _str_or_none),
+        ("disease", "disease", _str_or_none),
+        ("drugs", "drugs", _str_list),
+        ("description", "description", _str_or_none),
+        ("source", "source", _str_or_none),
+        ("rating", "rating", _int_or_none),
+    ]
+)
+
+_CLINVAR_FIELDS = _compile_field_map(
+    [
+        ("clinical_significance", "clinical_significance", _clinical_significance),
+        ("review_status", "review_status", _str_or_none),
+        ("conditions", "conditions", _condition_names),
+        ("last_evaluated", "last_evaluated", _str_or_none),
+        ("variation_id", "variation_id", _str_or_none),
+    ]
+)
+
+_COSMIC_FIELDS = _compile_field_map(
+    [
+        ("mutation_id", "mutation_id", _str_or_none),
+        ("primary_site", "primary_site", _str_or_none),
+        ("site_subtype", "site_subtype", _str_or_none),
+        ("primary_histology", "primary_histology", _str_or_none),
+        ("histology_subtype", "histology_subtype", _str_or_none),
+        ("sample_count", "sample_count", _int_or_none),
+        ("mutation_somatic_status", "mutation_somatic_status", _str_or_none),
+    ]
+)
+
+
+_GENOMIC_HGVS_PREFIXES = ("chr", "NC_")
+
+
+def _hgvs_kind(hgvs: str) -> str | None:
+    """Classify an HGVS string as genomic ("g"), protein ("p"), or coding ("c")."""
+    if hgvs.startswith(_GENOMIC_HGVS_PREFIXES):
+        return "g"
+    prefix = hgvs.partition(":")[2][:2]
+    if prefix == "p.":
+        return "p"
+    if prefix == "c.":
+        return "c"
+    return None
+
+
+def _batch_term(variant: str) -> str:
+    """Convert variant notation to the term used for batch (scoped) queries."""
+    return variant[2:] if variant.startswith("p.") else variant
+
+
+def _is_civic_variant(hit: dict[str, Any], gene: str, term: str) -> bool:
+    """Check whether a raw hit's CIViC record names exactly this gene and variant."""
+    gene, term = gene.upper(), term.upper()
+    for item in _as_list(hit.get("civic")):
+        if type(item) is not dict:
+            continue
+        entrez_name, name = item.get("entrez_name"), item.get("name")
+        if isinstance(entrez_name, str) and isinstance(name, str):
+            if entrez_name.upper() == gene and name.upper() == term:
+                return True
+    return False
+
+
+# Response bodies larger than this (bytes) are JSON-decoded off the event loop;
+# smaller ones stay inline, where a thread hop would cost more than the parse
+THREADED_PARSE_THRESHOLD = 64 * 1024
+
+# Transient HTTP statuses worth retrying; other 4xx responses are permanent
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on how long a server-provided Retry-After is honored (seconds)
+MAX_RETRY_AFTER = 60.0
+
+# Jittered exponential backoff: sleep uniformly in [0, min(max, multiplier * 2**(n-1))]
+RETRY_BACKOFF_MULTIPLIER = 0.5
+RETRY_MAX_BACKOFF = 10.0
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Check whether a request failure is transient and worth retrying."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _retry_delay(exc: BaseException, attempt: int) -> float:
+    """Honor Retry-After on 429 responses, else use jittered exponential backoff."""
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+        retry_after = _parse_retry_after(exc.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER)
+    return random.uniform(0, min(RETRY_MAX_BACKOFF, RETRY_BACKOFF_MULTIPLIER * 2 ** (attempt - 1)))
+
+
+# Process-wide evidence memoization, keyed by normalized (gene, variant)
+EVIDENCE_CACHE_SIZE = 4096
+EVIDENCE_CACHE_TTL = 3600.0
+# Lookups with no hits expire sooner, since new curations may appear
+EVIDENCE_NEGATIVE_CACHE_TTL = 300.0
+_evidence_cache: TTLCache[tuple[str, str], Evidence] = TTLCache(
+    maxsize=EVIDENCE_CACHE_SIZE, ttl=EVIDENCE_CACHE_TTL
+)
+# In-flight lookups per event loop; a task can only be awaited from its own loop
+_inflight_evidence: _LoopRegistry[tuple[str, str], "asyncio.Task[Evidence]"] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _evidence_key(gene: str, variant: str) -> tuple[str, str]:
+    """Normalize a gene/variant pair into an evidence cache key."""
+    return gene.strip().upper(), variant.strip().upper()
+
+
+def _for_caller(evidence: Evidence, gene: str, variant: str) -> Evidence:
+    """Return cached evidence labelled with the caller's gene/variant spelling."""
+    if evidence.gene == gene and evidence.variant == variant:
+        return evidence
+    return evidence.model_copy(update={"gene": gene, "variant": variant})
 
 
 class MyVariantAPIError(Exception):
@@ -47,45 +463,133 @@ class MyVariantClient:
 
     BASE_URL = "https://myvariant.info/v1"
     DEFAULT_TIMEOUT = 30.0
+    DEFAULT_MAX_CONCURRENCY = 32
+    DEFAULT_CACHE_DIR = Path(".myvariant_cache")
+    DISK_CACHE_TTL = 7 * 24 * 3600.0
+    DISK_CACHE_NEGATIVE_TTL = EVIDENCE_NEGATIVE_CACHE_TTL
+    DISK_CACHE_MAX_ENTRIES = 10_000
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0,
+    )
+
+    # Max query terms per POST /query request
+    BATCH_SIZE = 100
+    # CIViC variant names (e.g. "V600E") are the field that term-matches our
+    # variant notation; batch hits are then checked against the CIViC gene.
+    BATCH_SCOPES = "civic.name"
 
     def __init__(
         self,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 3,
+        cache_dir: str | Path | None = DEFAULT_CACHE_DIR,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        warm_pool: bool = True,
     ) -> None:
         """Initialize the MyVariant client.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache_dir: Directory for the persistent response cache (None disables it)
+            max_concurrency: Maximum number of in-flight API requests
+            warm_pool: Warm the shared pool and keep it alive in the background;
+                disable for short-lived event loops that shut down after one lookup
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.warm_pool = warm_pool
+        self._sem = asyncio.Semaphore(max_concurrency)
         self._client: httpx.AsyncClient | None = None
+        self._disk_cache = (
+            SQLiteCache(cache_dir, max_entries=self.DISK_CACHE_MAX_ENTRIES)
+            if cache_dir is not None
+            else None
+        )
 
     async def __aenter__(self) -> "MyVariantClient":
-        """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        """Async context manager entry.
+
+        Unless warm_pool is off, starts warming the shared connection pool
+        in the background.
+        """
+        if self.warm_pool:
+            self._client = _warm_shared_client(self.timeout, self.DEFAULT_LIMITS, self.BASE_URL)
+        else:
+            self._client = _get_shared_client(self.timeout, self.DEFAULT_LIMITS)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Async context manager exit.
+
+        The underlying HTTP client is shared per event loop, so it is only
+        released here; use shutdown_shared_client() to close it.
+        """
+        await self.close()
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+        """Get the shared HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = _get_shared_client(self.timeout, self.DEFAULT_LIMITS)
         return self._client
 
-    @retry(
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
-    async def _query(self, query: str, fields: list[str] | None = None) -> dict[str, Any]:
+    async def _request_json(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request and decode its JSON body with orjson.
+
+        The response is streamed: the status is checked before the body is
+        downloaded, and the raw bytes are parsed directly without a text
+        decode step. Bodies over THREADED_PARSE_THRESHOLD bytes are parsed in
+        a worker thread to keep the event loop responsive.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Extra arguments for httpx (params, data, ...)
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            httpx.HTTPStatusError: If the response status is an error
+        """
+        client = self._get_client()
+        async with self._sem:
+            async with client.stream(method, url, **kwargs) as response:
+                response.raise_for_status()
+                body = await response.aread()
+
+        # Parsing very large bodies inline would stall other coroutines
+        if len(body) > THREADED_PARSE_THRESHOLD:
+            return await asyncio.to_thread(orjson.loads, body)
+        return orjson.loads(body)
+
+    async def _with_retries(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await call(), retrying transient failures up to max_retries attempts.
+
+        Args:
+            call: Zero-argument coroutine factory performing one attempt
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            httpx.HTTPError: The last error, if it is permanent or attempts run out
+        """
+        attempt = 1
+        while True:
+            try:
+                return await call()
+            except httpx.HTTPError as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(e, attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _query(self, query: str, fields: Sequence[str] | None = None) -> dict[str, Any]:
         """Execute a query against MyVariant API.
 
         Args:
@@ -98,21 +602,67 @@ class MyVariantClient:
         Raises:
             MyVariantAPIError: If the API request fails
         """
-        client = self._get_client()
-        params: dict[str, str] = {"q": query}
+        return await self._with_retries(lambda: self._query_once(query, fields))
 
-        if fields:
-            params["fields"] = ",".join(fields)
+    async def _query_once(self, query: str, fields: Sequence[str] | None = None) -> dict[str, Any]:
+        """Execute a single query attempt; see _query."""
+        fields_csv = _fields_param(fields) if fields else ""
+        params = {"q": query, "fields": fields_csv} if fields_csv else {"q": query}
+
+        cache_key = hashlib.blake2b(f"{query}|{fields_csv}".encode()).hexdigest()
+        # SQLite calls block on disk I/O, so they run in a worker thread
+        if self._disk_cache is not None:
+            cached: dict[str, Any] | None = await asyncio.to_thread(self._disk_cache.get, cache_key)
+            if cached is not None:
+                return cached
 
-        response = await client.get(f"{self.BASE_URL}/query", params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = await self._request_json("GET", f"{self.BASE_URL}/query", params=params)
 
         if "error" in data:
             raise MyVariantAPIError(f"API error: {data['error']}")
 
+        if self._disk_cache is not None:
+            expire = self.DISK_CACHE_TTL if data.get("total", 0) else self.DISK_CACHE_NEGATIVE_TTL
+            await asyncio.to_thread(self._disk_cache.set, cache_key, data, expire)
+
         return data
 
+    async def _query_many(
+        self, terms: list[str], scopes: str, fields: Sequence[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute a batch query (POST /query) against MyVariant API.
+
+        Args:
+            terms: Query terms, each matched against the scoped fields
+            scopes: Comma-separated fields to match terms against
+            fields: Specific fields to retrieve
+
+        Returns:
+            List of hits; each carries the originating term under "query",
+            and unmatched terms come back with "notfound": true
+
+        Raises:
+            MyVariantAPIError: If the API request fails
+        """
+        return await self._with_retries(lambda: self._query_many_once(terms, scopes, fields))
+
+    async def _query_many_once(
+        self, terms: list[str], scopes: str, fields: Sequence[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute a single batch query attempt; see _query_many."""
+        body: dict[str, str] = {"q": ",".join(terms), "scopes": scopes}
+
+        if fields:
+            body["fields"] = _fields_param(fields)
+
+        data = await self._request_json("POST", f"{self.BASE_URL}/query", data=body)
+
+        if isinstance(data, dict) and "error" in data:
+            raise MyVariantAPIError(f"API error: {data['error']}")
+
+        hits: list[dict[str, Any]] = data
+        return hits
+
     async def get_variant(self, variant_id: str) -> dict[str, Any]:
         """Get variant by ID.
 
@@ -122,10 +672,36 @@ class MyVariantClient:
         Returns:
             Variant data
         """
-        client = self._get_client()
-        response = await client.get(f"{self.BASE_URL}/variant/{variant_id}")
-        response.raise_for_status()
-        return response.json()
+        return await self._request_json("GET", f"{self.BASE_URL}/variant/{variant_id}")
+
+    async def _query_first_match(
+        self, queries: list[str], fields: Sequence[str] | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        """Run fallback queries concurrently and return the best match.
+
+        All queries are in flight at once, but results are consumed in
+        priority order: the first query with hits wins and the lower-priority
+        requests still running are cancelled. If nothing matches, the last
+        query and its (empty) result are returned.
+
+        Args:
+            queries: Query strings, highest priority first
+            fields: Specific fields to retrieve
+
+        Returns:
+            Tuple of (matching query, API response)
+        """
+        tasks = [asyncio.create_task(self._query(q, fields=fields)) for q in queries]
+        try:
+            for query, task in zip(queries, tasks, strict=True):
+                result = await task
+                if result.get("total", 0) > 0:
+                    return query, result
+            return query, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def _parse_civic_evidence(self, civic_data: dict[str, Any] | list[Any]) -> list[CIViCEvidence]:
         """Parse CIViC data into evidence objects.
@@ -138,52 +714,20 @@ class MyVariantClient:
         """
         evidence_list: list[CIViCEvidence] = []
 
-        # Handle both single dict and list of dicts
-        items = civic_data if isinstance(civic_data, list) else [civic_data]
-
-        for item in items:
-            if not isinstance(item, dict):
+        for item in _as_list(civic_data):
+            if type(item) is not dict:
                 continue
 
             # CIViC can have nested evidence items
             if "evidence_items" in item:
-                for ev_item in item.get("evidence_items", []):
-                    evidence_list.append(
-                        CIViCEvidence(
-                            evidence_type=ev_item.get("evidence_type"),
-                            evidence_level=ev_item.get("evidence_level"),
-                            evidence_direction=ev_item.get("evidence_direction"),
-                            clinical_significance=ev_item.get("clinical_significance"),
-                            disease=ev_item.get("disease", {}).get("name")
-                            if isinstance(ev_item.get("disease"), dict)
-                            else None,
-                            drugs=[
-                                drug.get("name", "")
-                                for drug in ev_item.get("drugs", [])
-                                if isinstance(drug, dict)
-                            ],
-                            description=ev_item.get("description"),
-                            source=ev_item.get("source", {}).get("name")
-                            if isinstance(ev_item.get("source"), dict)
-                            else None,
-                            rating=ev_item.get("rating"),
-                        )
+                evidence_list.extend(
+                    _parse_items(
+                        item["evidence_items"] or [], CIViCEvidence, _CIVIC_EVIDENCE_ITEM_FIELDS
                     )
+                )
             else:
                 # Direct evidence object
-                evidence_list.append(
-                    CIViCEvidence(
-                        evidence_type=item.get("evidence_type"),
-                        evidence_level=item.get("evidence_level"),
-                        evidence_direction=item.get("evidence_direction"),
-                        clinical_significance=item.get("clinical_significance"),
-                        disease=item.get("disease"),
-                        drugs=item.get("drugs", []) if isinstance(item.get("drugs"), list) else [],
-                        description=item.get("description"),
-                        source=item.get("source"),
-                        rating=item.get("rating"),
-                    )
-                )
+                evidence_list.extend(_parse_items(item, CIViCEvidence, _CIVIC_DIRECT_FIELDS))
 
         return evidence_list
 
@@ -198,44 +742,7 @@ class MyVariantClient:
         Returns:
             List of ClinVar evidence objects
         """
-        evidence_list: list[ClinVarEvidence] = []
-
-        # Handle both single dict and list of dicts
-        items = clinvar_data if isinstance(clinvar_data, list) else [clinvar_data]
-
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-
-            # Extract clinical significance
-            clin_sig = item.get("clinical_significance")
-            if isinstance(clin_sig, list):
-                clin_sig = ", ".join(str(s) for s in clin_sig)
-
-            # Extract conditions
-            conditions = []
-            if "conditions" in item:
-                cond_data = item["conditions"]
-                if isinstance(cond_data, list):
-                    for cond in cond_data:
-                        if isinstance(cond, dict):
-                            conditions.append(cond.get("name", ""))
-                        else:
-                            conditions.append(str(cond))
-                elif isinstance(cond_data, dict):
-                    conditions.append(cond_data.get("name", ""))
-
-            evidence_list.append(
-                ClinVarEvidence(
-                    clinical_significance=str(clin_sig) if clin_sig else None,
-                    review_status=item.get("review_status"),
-                    conditions=conditions,
-                    last_evaluated=item.get("last_evaluated"),
-                    variation_id=str(item.get("variation_id")) if "variation_id" in item else None,
-                )
-            )
-
-        return evidence_list
+        return _parse_items(clinvar_data, ClinVarEvidence, _CLINVAR_FIELDS)
 
     def _parse_cosmic_evidence(
         self, cosmic_data: dict[str, Any] | list[Any]
@@ -248,47 +755,29 @@ class MyVariantClient:
         Returns:
             List of COSMIC evidence objects
         """
-        evidence_list: list[COSMICEvidence] = []
-
-        # Handle both single dict and list of dicts
-        items = cosmic_data if isinstance(cosmic_data, list) else [cosmic_data]
-
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-
-            evidence_list.append(
-                COSMICEvidence(
-                    mutation_id=item.get("mutation_id"),
-                    primary_site=item.get("primary_site"),
-                    site_subtype=item.get("site_subtype"),
-                    primary_histology=item.get("primary_histology"),
-                    histology_subtype=item.get("histology_subtype"),
-                    sample_count=item.get("sample_count"),
-                    mutation_somatic_status=item.get("mutation_somatic_status"),
-                )
-            )
-
-        return evidence_list
+        return _parse_items(cosmic_data, COSMICEvidence, _COSMIC_FIELDS)
 
-    def _extract_from_hit(self, hit: MyVariantHit, gene: str, variant: str) -> Evidence:
-        """Extract Evidence fields from a parsed MyVariantHit using Pydantic models.
+    def _extract_from_hit(self, raw_hit: dict[str, Any], gene: str, variant: str) -> Evidence:
+        """Extract Evidence fields from a raw MyVariant hit using Pydantic models.
 
-        This method uses Pydantic's automatic parsing instead of manual nested
-        dictionary navigation, making it cleaner and more maintainable.
+        The hit is validated into a MyVariantHit in one pydantic-core pass for
+        the identifier and annotation fields; the source evidence parsers work
+        directly on the raw dicts, which keep every field the API returned.
 
         Args:
-            hit: Parsed MyVariant API hit
+            raw_hit: Raw MyVariant API hit
             gene: Gene symbol
             variant: Variant notation
 
         Returns:
             Evidence object with all extracted fields
         """
+        hit = MyVariantHit.model_validate(raw_hit)
+
         # Extract database identifiers using Pydantic models
         cosmic_id = None
         if hit.cosmic:
-            cosmic_data = hit.cosmic if isinstance(hit.cosmic, list) else [hit.cosmic]
+            cosmic_data = _as_list(hit.cosmic)
             if cosmic_data and cosmic_data[0].cosmic_id:
                 cosmic_id = cosmic_data[0].cosmic_id
 
@@ -308,7 +797,7 @@ class MyVariantClient:
         clinvar_clinical_significance = None
         clinvar_accession = None
         if hit.clinvar:
-            clinvar_list = hit.clinvar if isinstance(hit.clinvar, list) else [hit.clinvar]
+            clinvar_list = _as_list(hit.clinvar)
             if clinvar_list:
                 first_clinvar = clinvar_list[0]
                 if first_clinvar.variant_id:
@@ -321,24 +810,23 @@ class MyVariantClient:
                     if first_rcv.accession:
                         clinvar_accession = first_rcv.accession
 
-        # Extract HGVS notations
-        hgvs_genomic = None
-        hgvs_protein = None
-        hgvs_transcript = None
+        # Extract HGVS notations: the last genomic form wins (the variant id
+        # is only a fallback); protein and transcript keep the first seen
+        hgvs_by_kind: dict[str, str | None] = {"g": None, "p": None, "c": None}
 
         # Use variant id as genomic HGVS if it looks like HGVS
-        if hit.id and (hit.id.startswith("chr") or hit.id.startswith("NC_")):
-            hgvs_genomic = hit.id
+        if hit.id and hit.id.startswith(_GENOMIC_HGVS_PREFIXES):
+            hgvs_by_kind["g"] = hit.id
 
         if hit.hgvs:
-            hgvs_list = [hit.hgvs] if isinstance(hit.hgvs, str) else hit.hgvs
-            for hgvs in hgvs_list:
-                if hgvs.startswith("chr") or hgvs.startswith("NC_"):
-                    hgvs_genomic = hgvs
-                elif ":p." in hgvs and not hgvs_protein:
-                    hgvs_protein = hgvs
-                elif ":c." in hgvs and not hgvs_transcript:
-                    hgvs_transcript = hgvs
+            for hgvs in _as_list(hit.hgvs):
+                kind = _hgvs_kind(hgvs)
+                if kind == "g" or (kind is not None and hgvs_by_kind[kind] is None):
+                    hgvs_by_kind[kind] = hgvs
+
+        hgvs_genomic = hgvs_by_kind["g"]
+        hgvs_protein = hgvs_by_kind["p"]
+        hgvs_transcript = hgvs_by_kind["c"]
 
         # Extract functional annotations using Pydantic models
         snpeff_effect = None
@@ -346,7 +834,7 @@ class MyVariantClient:
         transcript_consequence = None
         if hit.snpeff and hit.snpeff.ann:
             ann = hit.snpeff.ann
-            ann_data = ann if isinstance(ann, list) else [ann]
+            ann_data = _as_list(ann)
             if ann_data:
                 first_ann = ann_data[0]
                 snpeff_effect = first_ann.effect
@@ -384,21 +872,11 @@ class MyVariantClient:
 
         clinvar_evidence = []
         if hit.clinvar:
-            # Convert back to dict for existing parser
-            clinvar_data = hit.clinvar
-            if isinstance(clinvar_data, list):
-                clinvar_evidence = self._parse_clinvar_evidence([c.model_dump() for c in clinvar_data])
-            else:
-                clinvar_evidence = self._parse_clinvar_evidence(clinvar_data.model_dump())
+            clinvar_evidence = self._parse_clinvar_evidence(raw_hit["clinvar"])
 
         cosmic_evidence = []
         if hit.cosmic:
-            # Convert back to dict for existing parser
-            cosmic_data = hit.cosmic
-            if isinstance(cosmic_data, list):
-                cosmic_evidence = self._parse_cosmic_evidence([c.model_dump() for c in cosmic_data])
-            else:
-                cosmic_evidence = self._parse_cosmic_evidence(cosmic_data.model_dump())
+            cosmic_evidence = self._parse_cosmic_evidence(raw_hit["cosmic"])
 
         return Evidence(
             variant_id=hit.id,
@@ -422,12 +900,17 @@ class MyVariantClient:
             civic=civic_evidence,
             clinvar=clinvar_evidence,
             cosmic=cosmic_evidence,
-            raw_data=hit.model_dump(by_alias=True),
+            raw_data=raw_hit,
         )
 
     async def fetch_evidence(self, gene: str, variant: str) -> Evidence:
         """Fetch evidence for a variant from multiple sources.
 
+        Results are memoized process-wide (see EVIDENCE_CACHE_SIZE and
+        EVIDENCE_CACHE_TTL; lookups with no hits use the shorter
+        EVIDENCE_NEGATIVE_CACHE_TTL), and concurrent calls for the same
+        variant on the same event loop share a single in-flight lookup.
+
         Args:
             gene: Gene symbol (e.g., "BRAF")
             variant: Variant notation (e.g., "V600E")
@@ -438,83 +921,144 @@ class MyVariantClient:
         Raises:
             MyVariantAPIError: If the API request fails
         """
-        # Request specific fields from CIViC, ClinVar, COSMIC, and identifiers
-        fields = [
-            "civic",
-            "clinvar",
-            "cosmic",
-            "dbsnp",
-            "cadd",
-            "entrezgene",  # NCBI Gene ID
-            "cosmic.cosmic_id",  # COSMIC mutation ID
-            "clinvar.variant_id",  # ClinVar variation ID
-            "clinvar.rcv",  # ClinVar RCV records (contains clinical_significance and accession)
-            "dbsnp.rsid",  # dbSNP rs number
-            "hgvs",  # HGVS notations (genomic, protein, transcript)
-            "snpeff",  # SnpEff effect prediction
-            "dbnsfp.polyphen2.hdiv.pred",  # PolyPhen2 prediction
-            "dbnsfp.cadd.phred",  # CADD phred score
-            "gnomad_exome.af.af",  # gnomAD exome allele frequency
-            "vcf.alt",  # VCF alternative allele
-            "vcf.ref",  # VCF reference allele
-        ]
+        key = _evidence_key(gene, variant)
+        evidence = _evidence_cache.get(key)
+
+        if evidence is None:
+            inflight = _for_running_loop(_inflight_evidence)
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._fetch_and_cache_evidence(key, gene, variant))
+                inflight[key] = task
+                task.add_done_callback(lambda _: inflight.pop(key, None))
+            # Shield so one cancelled caller does not cancel the shared lookup
+            evidence = await asyncio.shield(task)
+
+        return _for_caller(evidence, gene, variant)
+
+    async def _fetch_and_cache_evidence(
+        self, key: tuple[str, str], gene: str, variant: str
+    ) -> Evidence:
+        """Fetch evidence for a variant from the API and store it in the cache.
 
+        Args:
+            key: Evidence cache key for the variant
+            gene: Gene symbol (e.g., "BRAF")
+            variant: Variant notation (e.g., "V600E")
+
+        Returns:
+            Aggregated evidence from all sources
+
+        Raises:
+            MyVariantAPIError: If the API request fails
+        """
         try:
-            # Try multiple query strategies to find the variant
-            # Strategy 1: Gene with protein notation (e.g., "BRAF p.V600E")
-            # This works best with MyVariant API
+            # Try multiple query strategies to find the variant, in priority order:
+            # 1. Gene with protein notation (e.g., "BRAF p.V600E") - works best
+            # 2. Simple gene:variant (e.g., "BRAF:V600E")
+            # 3. Gene name and variant without prefix (e.g., "BRAF V600E")
             protein_notation = f"p.{variant}" if not variant.startswith("p.") else variant
-            query = f"{gene} {protein_notation}"
-            result = await self._query(query, fields=fields)
-
-            # Strategy 2: If no hits, try simple gene:variant (e.g., "BRAF:V600E")
-            if result.get("total", 0) == 0:
-                query = f"{gene}:{variant}"
-                result = await self._query(query, fields=fields)
-
-            # Strategy 3: If still no hits, try searching by gene name and variant without prefix
-            if result.get("total", 0) == 0:
-                query = f"{gene} {variant}"
-                result = await self._query(query, fields=fields)
-
-            # Parse response using Pydantic
-            parsed_response = MyVariantResponse(**result)
-
-            if not parsed_response.hits:
-                # No data found, return empty evidence
-                return Evidence(
-                    variant_id=query,
-                    gene=gene,
-                    variant=variant,
-                    cosmic_id=None,
-                    ncbi_gene_id=None,
-                    dbsnp_id=None,
-                    clinvar_id=None,
-                    clinvar_clinical_significance=None,
-                    clinvar_accession=None,
-                    hgvs_genomic=None,
-                    hgvs_protein=None,
-                    hgvs_transcript=None,
-                    snpeff_effect=None,
-                    polyphen2_prediction=None,
-                    cadd_score=None,
-                    gnomad_exome_af=None,
-                    transcript_id=None,
-                    transcript_consequence=None,
-                    raw_data=result,
+            queries = [
+                f"{gene} {protein_notation}",
+                f"{gene}:{variant}",
+                f"{gene} {variant}",
+            ]
+            query, result = await self._query_first_match(queries, fields=_EVIDENCE_FIELDS)
+
+            # Only the first hit is used, so only it gets validated
+            hits = result.get("hits") or []
+
+            if not hits:
+                # No data found: an empty Evidence needs no validation
+                evidence = Evidence.model_construct(
+                    variant_id=query, gene=gene, variant=variant, raw_data=result
                 )
+                _evidence_cache.set(key, evidence, ttl=EVIDENCE_NEGATIVE_CACHE_TTL)
+                return evidence
 
             # Use the first hit (most relevant) and extract using Pydantic models
-            first_hit = parsed_response.hits[0]
-            return self._extract_from_hit(first_hit, gene, variant)
+            evidence = self._extract_from_hit(hits[0], gene, variant)
+            _evidence_cache.set(key, evidence)
+            return evidence
 
         except MyVariantAPIError:
             raise
         except Exception as e:
             raise MyVariantAPIError(f"Failed to parse evidence: {str(e)}")
 
+    async def fetch_evidence_many(self, pairs: list[tuple[str, str]]) -> list[Evidence]:
+        """Fetch evidence for many variants with batched API requests.
+
+        Cached variants are served from memory; the rest are looked up in
+        POST /query batches of BATCH_SIZE terms scoped to CIViC variant names.
+
+        A batch hit is used only when it is the single hit whose CIViC record
+        names this exact gene and variant: the curated document that the
+        free-text "GENE p.VARIANT" single lookup also ranks first. Batch and
+        single results share the evidence cache, so anything less certain
+        falls back to fetch_evidence(). Variants not curated in CIViC thus
+        cost their share of the POST plus the full single-lookup fallback;
+        batching pays off for panels that are mostly CIViC variants.
+
+        Args:
+            pairs: (gene, variant) tuples
+
+        Returns:
+            Evidence for each pair, in input order
+
+        Raises:
+            MyVariantAPIError: If the API request fails
+        """
+        cached = [_evidence_cache.get(_evidence_key(gene, variant)) for gene, variant in pairs]
+        pending = [pair for pair, evidence in zip(pairs, cached, strict=True) if evidence is None]
+
+        terms = list(dict.fromkeys(_batch_term(variant) for _, variant in pending))
+        chunks = [terms[i : i + self.BATCH_SIZE] for i in range(0, len(terms), self.BATCH_SIZE)]
+        try:
+            responses = await asyncio.gather(
+                *(
+                    self._query_many(chunk, self.BATCH_SCOPES, fields=_EVIDENCE_FIELDS)
+                    for chunk in chunks
+                )
+            )
+        except httpx.HTTPError as e:
+            raise MyVariantAPIError(f"Batch query failed: {str(e)}") from e
+
+        hits_by_term: dict[str, list[dict[str, Any]]] = {}
+        for response in responses:
+            for hit in response:
+                if isinstance(hit, dict) and not hit.get("notfound"):
+                    hits_by_term.setdefault(str(hit.get("query")), []).append(hit)
+
+        async def resolve(gene: str, variant: str) -> Evidence:
+            term = _batch_term(variant)
+            matches = [
+                hit for hit in hits_by_term.get(term, []) if _is_civic_variant(hit, gene, term)
+            ]
+            if len(matches) != 1:
+                # No curated match, or several documents to choose between
+                return await self.fetch_evidence(gene, variant)
+
+            try:
+                evidence = self._extract_from_hit(matches[0], gene, variant)
+            except Exception as e:
+                raise MyVariantAPIError(f"Failed to parse evidence: {str(e)}") from e
+            _evidence_cache.set(_evidence_key(gene, variant), evidence)
+            return evidence
+
+        resolved = iter(
+            await asyncio.gather(*(resolve(gene, variant) for gene, variant in pending))
+        )
+        return [
+            _for_caller(evidence, gene, variant) if evidence is not None else next(resolved)
+            for (gene, variant), evidence in zip(pairs, cached, strict=True)
+        ]
+
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the shared HTTP client (it stays open for other instances).
+
+        Also closes the persistent cache connection.
+        """
+        self._client = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
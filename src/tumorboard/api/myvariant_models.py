@@ -117,12 +117,3 @@ class MyVariantHit(BaseModel):
 
     # CIViC and other evidence (kept as dict for existing parsers)
     civic: dict[str, Any] | list[dict[str, Any]] | None = None
-
-
-class MyVariantResponse(BaseModel):
-    """MyVariant API response structure."""
-
-    took: int | None = None
-    total: int = 0  # Default to 0 if not provided
-    max_score: float | None = None
-    hits: list[MyVariantHit] = Field(default_factory=list)
@@ -7,17 +7,17 @@ Three workflows: assess (single), batch (concurrent), validate (benchmarking)
 
 Key Design:
 - Typer framework for auto-help and type validation
-- asyncio.run() bridges sync CLI → async engine
+- asyncio.run() (via run_with_shared_client) bridges sync CLI → async engine
 - Flexible I/O: stdout or JSON file output
 """
 
-import asyncio
 import json
 import warnings
 from pathlib import Path
 from typing import Optional
 import typer
 from dotenv import load_dotenv
+from tumorboard.api.myvariant import run_with_shared_client
 from tumorboard.engine import AssessmentEngine
 from tumorboard.models.variant import VariantInput
 from tumorboard.validation.validator import Validator
@@ -65,7 +65,7 @@ def assess(
                     json.dump(output_data, f, indent=2)
                 print(f"Saved to {output}")
 
-    asyncio.run(run_assessment())
+    run_with_shared_client(run_assessment())
 
 
 @app.command()
@@ -109,7 +109,7 @@ def batch(
             for tier, count in sorted(tier_counts.items()):
                 print(f"  {tier}: {count}")
 
-    asyncio.run(run_batch())
+    run_with_shared_client(run_batch())
 
 
 @app.command()
@@ -144,7 +144,7 @@ def validate(
                     json.dump(output_data, f, indent=2)
                 print(f"\nDetailed results saved to {output}")
 
-    asyncio.run(run_validation())
+    run_with_shared_client(run_validation())
 
 
 @app.command()
@@ -8,15 +8,20 @@ Orchestrates the pipeline with async concurrency for single and batch processing
 Key Design:
 - Async context manager for HTTP session lifecycle
 - Sequential per-variant, parallel across variants (asyncio.gather)
+- Batch evidence prefetched with batched MyVariant requests
 - Batch exceptions captured, not raised
-- Stateless with no shared state
+- Engines hold no state of their own; the evidence cache and HTTP pool
+  are shared by every MyVariantClient (see tumorboard.api.myvariant)
 """
 
 import asyncio
-from tumorboard.api.myvariant import MyVariantClient
+from collections.abc import Sequence
+
+from tumorboard.api.myvariant import MyVariantAPIError, MyVariantClient
 from tumorboard.llm.service import LLMService
 from tumorboard.models.assessment import ActionabilityAssessment
-from tumorboard.models.variant import VariantInput
+from tumorboard.models.evidence import Evidence
+from tumorboard.models.variant import Variant, VariantInput
 
 
 class AssessmentEngine:
@@ -27,8 +32,13 @@ class AssessmentEngine:
     significantly improving performance for batch assessments.
     """
 
-    def __init__(self, llm_model: str = "gpt-4o-mini", llm_temperature: float = 0.1):
-        self.myvariant_client = MyVariantClient()
+    def __init__(
+        self,
+        llm_model: str = "gpt-4o-mini",
+        llm_temperature: float = 0.1,
+        warm_pool: bool = True,
+    ):
+        self.myvariant_client = MyVariantClient(warm_pool=warm_pool)
         self.llm_service = LLMService(model=llm_model, temperature=llm_temperature)
 
     async def __aenter__(self):
@@ -44,20 +54,23 @@ class AssessmentEngine:
         """Close HTTP client session to prevent resource leaks."""
         await self.myvariant_client.__aexit__(exc_type, exc_val, exc_tb)
 
-    async def assess_variant(self, variant_input: VariantInput) -> ActionabilityAssessment:
+    async def assess_variant(
+        self, variant_input: Variant | VariantInput, evidence: Evidence | None = None
+    ) -> ActionabilityAssessment:
         """Assess a single variant.
 
         Chains two async operations sequentially:
-        1. Fetch evidence from MyVariant API
+        1. Fetch evidence from MyVariant API (skipped if evidence is provided)
         2. Send evidence to LLM for assessment
 
         The 'await' keyword yields control during I/O, allowing other tasks to run.
         """
         # Fetch evidence from MyVariant API
-        evidence = await self.myvariant_client.fetch_evidence(
-            gene=variant_input.gene,
-            variant=variant_input.variant,
-        )
+        if evidence is None:
+            evidence = await self.myvariant_client.fetch_evidence(
+                gene=variant_input.gene,
+                variant=variant_input.variant,
+            )
 
         # Assess with LLM (must run sequentially since it depends on evidence)
         assessment = await self.llm_service.assess_variant(
@@ -70,17 +83,29 @@ class AssessmentEngine:
         return assessment
 
     async def batch_assess(
-        self, variants: list[VariantInput]
+        self, variants: Sequence[Variant | VariantInput]
     ) -> list[ActionabilityAssessment]:
         """
         Assess multiple variants concurrently.
 
         Uses asyncio.gather() to process all variants in parallel. While waiting for
         I/O (API/LLM calls), the event loop switches between tasks - no threading needed.
+        Evidence is prefetched in batched requests; if that fails, each variant
+        fetches its own evidence so failures stay per-variant.
         """
-        
+        pairs = [(variant.gene, variant.variant) for variant in variants]
+        try:
+            evidence_list: list[Evidence | None] = list(
+                await self.myvariant_client.fetch_evidence_many(pairs)
+            )
+        except MyVariantAPIError:
+            evidence_list = [None] * len(variants)
+
         # Create coroutines for each variant
-        tasks = [self.assess_variant(variant) for variant in variants]
+        tasks = [
+            self.assess_variant(variant, evidence=evidence)
+            for variant, evidence in zip(variants, evidence_list, strict=True)
+        ]
 
         # Run all tasks concurrently, capturing exceptions instead of raising
         results = await asyncio.gather(*tasks, return_exceptions=True)
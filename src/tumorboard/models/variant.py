@@ -1,19 +1,31 @@
-"""Variant data models."""
+"""Variant data models.
+
+VariantInput is the validated Pydantic model used at the edges (CLI input,
+REST API); Variant is a slotted dataclass for variants created internally
+from already-validated data, where validation and schema metadata are pure
+overhead.
+"""
+
+from dataclasses import dataclass
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
 class VariantInput(BaseModel):
-    """Input for variant assessment."""
+    """Input for variant assessment.
+
+    Immutable and hashable, so instances can be used as cache keys.
+    """
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "gene": "BRAF",
                 "variant": "V600E",
                 "tumor_type": "Melanoma",
             }
-        }
+        },
     )
 
     gene: str = Field(..., description="Gene symbol (e.g., BRAF)")
@@ -23,3 +35,29 @@ class VariantInput(BaseModel):
     def to_hgvs(self) -> str:
         """Convert to HGVS-like notation for API queries."""
         return f"{self.gene}:{self.variant}"
+
+
+@dataclass(slots=True, frozen=True)
+class Variant:
+    """Lightweight internal variant; fields are trusted, not validated."""
+
+    gene: str
+    variant: str
+    tumor_type: str | None = None
+
+    @classmethod
+    def from_api(cls, variant_input: VariantInput) -> "Variant":
+        """Create from a validated API input model."""
+        return cls(
+            gene=variant_input.gene,
+            variant=variant_input.variant,
+            tumor_type=variant_input.tumor_type,
+        )
+
+    def to_api(self) -> VariantInput:
+        """Convert to the validated API input model."""
+        return VariantInput(gene=self.gene, variant=self.variant, tumor_type=self.tumor_type)
+
+    def to_hgvs(self) -> str:
+        """Convert to HGVS-like notation for API queries."""
+        return f"{self.gene}:{self.variant}"
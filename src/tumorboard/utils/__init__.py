@@ -1 +1,5 @@
 """Utility functions."""
+
+from tumorboard.utils.cache import SQLiteCache, TTLCache
+
+__all__ = ["SQLiteCache", "TTLCache"]
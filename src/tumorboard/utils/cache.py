@@ -0,0 +1,171 @@
+"""In-memory and on-disk caching helpers."""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Size-bounded LRU cache whose entries expire after a time-to-live.
+
+    Thread-safe, so one cache can be shared by event loops running in
+    different threads.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Default entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, optionally overriding the default TTL."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """Persistent key/value cache for JSON-serializable values, backed by SQLite.
+
+    The database is opened lazily on first use. Storage errors are logged and
+    treated as cache misses so a broken cache never fails a lookup.
+
+    Calls block on disk I/O; async callers should run them in a worker thread
+    (asyncio.to_thread). Access is serialized with a lock, so the connection
+    can be used from any thread.
+
+    Size is bounded by entry count: purges drop expired rows, then the rows
+    closest to expiry beyond max_entries, so the table never holds more than
+    max_entries + PURGE_INTERVAL - 1 rows.
+    """
+
+    FILENAME = "cache.sqlite3"
+    # Expired and excess rows are purged when the database is opened and every this many writes
+    PURGE_INTERVAL = 256
+
+    def __init__(self, directory: str | Path, max_entries: int = 10_000) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache database (created if missing)
+            max_entries: Number of rows kept by each purge
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, create the table, and purge expired rows on first use."""
+        if self._conn is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.directory / self.FILENAME, check_same_thread=False)
+            # WAL with NORMAL sync avoids an fsync on every commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+            with conn:
+                self._purge(conn)
+            self._conn = conn
+        return self._conn
+
+    def _purge(self, conn: sqlite3.Connection) -> None:
+        """Delete expired rows, then the soonest-expiring rows beyond max_entries."""
+        conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing, expired, or unreadable."""
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                        (key, time.time()),
+                    )
+                    .fetchone()
+                )
+            return orjson.loads(row[0]) if row else None
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"Disk cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Any, expire: float) -> None:
+        """Store a value for expire seconds, periodically purging expired rows."""
+        try:
+            data = orjson.dumps(value)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, data, time.time() + expire),
+                    )
+                    self._writes += 1
+                    if self._writes % self.PURGE_INTERVAL == 0:
+                        self._purge(conn)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Disk cache write failed: {str(e)}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
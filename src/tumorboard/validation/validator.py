@@ -18,7 +18,7 @@ from typing import Any
 
 from tumorboard.engine import AssessmentEngine
 from tumorboard.models.validation import GoldStandardEntry, ValidationMetrics, ValidationResult
-from tumorboard.models.variant import VariantInput
+from tumorboard.models.variant import Variant
 
 logger = logging.getLogger(__name__)
 
@@ -85,8 +85,8 @@ class Validator:
         Returns:
             Validation result with comparison
         """
-        # Create variant input
-        variant_input = VariantInput(
+        # Entry fields are already validated, so use the lightweight variant
+        variant_input = Variant(
             gene=entry.gene,
             variant=entry.variant,
             tumor_type=entry.tumor_type,
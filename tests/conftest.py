@@ -1,8 +1,49 @@
 """Pytest configuration and fixtures."""
 
+from unittest.mock import AsyncMock, patch
+
+import httpx
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_evidence_cache():
+    """Isolate tests from the process-wide MyVariant evidence cache."""
+    from tumorboard.api import myvariant
+
+    myvariant._evidence_cache.clear()
+    yield
+    myvariant._evidence_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_pool_warmup_requests():
+    """Keep pool warm-up and keepalive pings from reaching myvariant.info."""
+    with patch("tumorboard.api.myvariant._ping", new_callable=AsyncMock) as mock_ping:
+        yield mock_ping
+
+
+@pytest.fixture
+async def mock_http():
+    """Serve MyVariantClient requests from a handler through httpx.MockTransport.
+
+    Yields serve(client, handler), which returns a patch context routing the
+    client's requests to handler. The HTTP clients it creates are closed on
+    teardown.
+    """
+    http_clients: list[httpx.AsyncClient] = []
+
+    def serve(client, handler):
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_clients.append(http_client)
+        return patch.object(client, "_get_client", return_value=http_client)
+
+    yield serve
+
+    for http_client in http_clients:
+        await http_client.aclose()
+
+
 @pytest.fixture
 def sample_variant_input():
     """Sample variant input for testing."""
@@ -1,9 +1,23 @@
 """Tests for API client."""
 
+import asyncio
+import threading
+import time
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from tumorboard.api.myvariant import MyVariantAPIError, MyVariantClient
+from tumorboard.api.myvariant import (
+    MyVariantAPIError,
+    MyVariantClient,
+    _is_retryable,
+    _keepalive,
+    _parse_retry_after,
+    _ping,
+    run_with_shared_client,
+    shutdown_shared_client,
+)
 from tumorboard.models.evidence import CIViCEvidence, ClinVarEvidence
 
 
@@ -18,6 +32,49 @@ class TestMyVariantClient:
 
         # Client should be closed after exit
         assert client._client is None
+        await shutdown_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_across_instances(self):
+        """Test that instances reuse one pooled HTTP client."""
+        async with MyVariantClient() as first, MyVariantClient() as second:
+            assert first._client is second._client
+
+        shared = MyVariantClient()._get_client()
+        assert not shared.is_closed
+
+        await shutdown_shared_client()
+        assert shared.is_closed
+
+    def test_shared_client_per_event_loop(self):
+        """Test that loops running in parallel threads keep separate shared clients."""
+        barrier = threading.Barrier(2)
+        results: dict[str, tuple[bool, bool]] = {}
+
+        async def run(name):
+            shared = MyVariantClient(cache_dir=None)._get_client()
+            # Both loops hold a client before either shuts down
+            await asyncio.to_thread(barrier.wait)
+            again = MyVariantClient(cache_dir=None)._get_client()
+            await shutdown_shared_client()
+            results[name] = (again is shared, shared.is_closed)
+
+        threads = [threading.Thread(target=asyncio.run, args=(run(name),)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {"a": (True, True), "b": (True, True)}
+
+    def test_run_with_shared_client_closes_pool(self):
+        """Test that the run helper returns the result and closes the loop's client."""
+
+        async def use_client():
+            return MyVariantClient(cache_dir=None)._get_client()
+
+        shared = run_with_shared_client(use_client())
+        assert shared.is_closed
 
     @pytest.mark.asyncio
     async def test_fetch_evidence_no_results(self):
@@ -178,3 +235,500 @@ class TestMyVariantClient:
             assert "p.V600E" in first_call_args[0][0] or "BRAF p.V600E" == first_call_args[0][0]
 
         await client.close()
+
+    @pytest.mark.asyncio
+    async def test_query_strategies_prefer_highest_priority_match(self):
+        """Test that concurrent strategies resolve to the earliest matching query."""
+        client = MyVariantClient()
+
+        async def fake_query(query, fields=None):
+            if query == "BRAF p.V600E":
+                return {"total": 0, "hits": []}
+            return {"total": 1, "hits": [{"_id": query}]}
+
+        with patch.object(client, "_query", side_effect=fake_query) as mock_query:
+            evidence = await client.fetch_evidence("BRAF", "V600E")
+
+            assert mock_query.call_count == 3
+            assert evidence.variant_id == "BRAF:V600E"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_evidence_many_batches_and_falls_back(self):
+        """Test batched lookup matches hits by CIViC gene and falls back per variant."""
+        client = MyVariantClient()
+
+        batch_hits = [
+            {
+                "query": "V600E",
+                "_id": "chr7:g.140453136A>T",
+                "civic": {"entrez_name": "BRAF", "name": "V600E"},
+            },
+            {
+                "query": "G12D",
+                "_id": "chr1:g.115258747C>T",
+                "civic": {"entrez_name": "NRAS", "name": "G12D"},
+            },
+        ]
+
+        with (
+            patch.object(client, "_query_many", new_callable=AsyncMock) as mock_many,
+            patch.object(client, "_query", new_callable=AsyncMock) as mock_query,
+        ):
+            mock_many.return_value = batch_hits
+            mock_query.return_value = {"total": 0, "hits": []}
+
+            results = await client.fetch_evidence_many([("BRAF", "V600E"), ("KRAS", "G12D")])
+
+            mock_many.assert_awaited_once()
+            assert mock_many.call_args[0][0] == ["V600E", "G12D"]
+            assert results[0].variant_id == "chr7:g.140453136A>T"
+            # NRAS hit does not match KRAS, so the single-variant strategies run
+            assert results[1].gene == "KRAS"
+            assert mock_query.await_count == 3
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_and_single_lookups_choose_same_document(self):
+        """Test that the batch path picks the CIViC document a single lookup returns."""
+        from tumorboard.api import myvariant
+
+        civic_doc = {
+            "_id": "chr7:g.140453136A>T",
+            "civic": {"entrez_name": "BRAF", "name": "V600E"},
+        }
+        # Another BRAF document matching the term only outside CIViC
+        other_doc = {
+            "_id": "chr7:g.140453136_140453137delinsTT",
+            "dbsnp": {"gene": {"symbol": "BRAF"}},
+            "civic": {"entrez_name": "BRAF", "name": "V600E_other"},
+        }
+
+        client = MyVariantClient(cache_dir=None)
+        with (
+            patch.object(client, "_query_many", new_callable=AsyncMock) as mock_many,
+            patch.object(client, "_query", new_callable=AsyncMock) as mock_query,
+        ):
+            mock_many.return_value = [
+                {"query": "V600E", **other_doc},
+                {"query": "V600E", **civic_doc},
+            ]
+            mock_query.return_value = {"total": 2, "hits": [civic_doc, other_doc]}
+
+            [batched] = await client.fetch_evidence_many([("BRAF", "V600E")])
+            mock_query.assert_not_awaited()
+
+            myvariant._evidence_cache.clear()
+            single = await client.fetch_evidence("BRAF", "V600E")
+
+        assert batched.variant_id == single.variant_id == "chr7:g.140453136A>T"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_evidence_many_falls_back_on_ambiguous_hits(self):
+        """Test that several CIViC documents for one variant defer to the single lookup."""
+        client = MyVariantClient(cache_dir=None)
+
+        hits = [
+            {"query": "V600E", "_id": doc_id, "civic": {"entrez_name": "BRAF", "name": "V600E"}}
+            for doc_id in ("chr7:g.140453136A>T", "chr7:g.140453136_140453137delinsTT")
+        ]
+
+        with (
+            patch.object(client, "_query_many", new_callable=AsyncMock) as mock_many,
+            patch.object(client, "_query", new_callable=AsyncMock) as mock_query,
+        ):
+            mock_many.return_value = hits
+            mock_query.return_value = {"total": 1, "hits": [{"_id": "chr7:g.140453136A>T"}]}
+
+            [evidence] = await client.fetch_evidence_many([("BRAF", "V600E")])
+
+            assert mock_query.await_count == 3
+            assert evidence.variant_id == "chr7:g.140453136A>T"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_assess_survives_failed_batch_query(self, mock_http):
+        """Test that a failed POST /query surfaces as MyVariantAPIError, not a crash."""
+        from tumorboard.engine import AssessmentEngine
+        from tumorboard.models.variant import VariantInput
+
+        handler = MagicMock(return_value=httpx.Response(500))
+
+        engine = AssessmentEngine()
+        engine.myvariant_client = MyVariantClient(cache_dir=None, max_retries=1)
+        with mock_http(engine.myvariant_client, handler):
+            with pytest.raises(MyVariantAPIError):
+                await engine.myvariant_client.fetch_evidence_many([("BRAF", "V600E")])
+
+            # Per-variant fallback lookups fail too, but are captured per variant
+            assert await engine.batch_assess([VariantInput(gene="BRAF", variant="V600E")]) == []
+
+        await engine.myvariant_client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_evidence_memoized_and_coalesced(self):
+        """Test repeated and concurrent lookups share one API round."""
+        client = MyVariantClient()
+
+        with patch.object(client, "_query", new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = {"total": 1, "hits": [{"_id": "test123"}]}
+
+            first, second = await asyncio.gather(
+                client.fetch_evidence("BRAF", "V600E"),
+                client.fetch_evidence("BRAF", "V600E"),
+            )
+            third = await client.fetch_evidence("braf", "v600e")
+
+            # One strategy round (3 concurrent queries) serves all three calls
+            assert mock_query.await_count == 3
+            assert first is second
+            assert third.variant_id == "test123"
+            assert third.gene == "braf"
+
+        await client.close()
+
+    def test_concurrent_lookups_on_separate_loops(self):
+        """Test that lookups on loops in different threads do not share in-flight tasks."""
+        barrier = threading.Barrier(2)
+        errors: list[BaseException] = []
+
+        async def slow_query(query, fields=None):
+            await asyncio.to_thread(barrier.wait, 5)
+            return {"total": 0, "hits": []}
+
+        async def run():
+            client = MyVariantClient(cache_dir=None)
+            with patch.object(client, "_query", side_effect=slow_query):
+                await client.fetch_evidence("BRAF", "V600E")
+
+        def target():
+            try:
+                asyncio.run(run())
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=target) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_query_uses_disk_cache(self, tmp_path, mock_http):
+        """Test that raw query responses persist across client instances."""
+        payload = {"total": 1, "hits": [{"_id": "test123"}]}
+        handler = MagicMock(return_value=httpx.Response(200, json=payload))
+
+        first = MyVariantClient(cache_dir=tmp_path)
+        with mock_http(first, handler):
+            assert await first._query("BRAF p.V600E") == payload
+        await first.close()
+
+        second = MyVariantClient(cache_dir=tmp_path)
+        with mock_http(second, handler):
+            assert await second._query("BRAF p.V600E") == payload
+        await second.close()
+
+        handler.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_evidence_with_unwritable_cache_dir(self, tmp_path, mock_http):
+        """Test that lookups still succeed when the disk cache cannot be opened."""
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("")
+        handler = MagicMock(
+            return_value=httpx.Response(200, json={"total": 1, "hits": [{"_id": "test123"}]})
+        )
+
+        client = MyVariantClient(cache_dir=not_a_dir / "cache")
+        with mock_http(client, handler):
+            evidence = await client.fetch_evidence("BRAF", "V600E")
+
+        assert evidence.variant_id == "test123"
+        await client.close()
+
+    def test_retry_classification(self):
+        """Test that only transient failures are retried."""
+        request = httpx.Request("GET", "https://myvariant.info/v1/query")
+
+        def status_error(code):
+            response = httpx.Response(code, request=request)
+            return httpx.HTTPStatusError("error", request=request, response=response)
+
+        assert _is_retryable(status_error(429))
+        assert _is_retryable(status_error(503))
+        assert _is_retryable(httpx.ReadTimeout("timeout", request=request))
+        assert _is_retryable(httpx.ConnectError("refused", request=request))
+        assert not _is_retryable(status_error(400))
+        assert not _is_retryable(status_error(404))
+        assert _parse_retry_after("7") == 7.0
+        assert _parse_retry_after("not a date") is None
+
+    @pytest.mark.asyncio
+    async def test_query_does_not_retry_client_errors(self, mock_http):
+        """Test that a 404 response fails immediately without retrying."""
+        handler = MagicMock(return_value=httpx.Response(404))
+
+        client = MyVariantClient(cache_dir=None)
+        with mock_http(client, handler):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._query("BRAF p.V600E")
+
+        handler.assert_called_once()
+        await client.close()
+
+    def test_parse_cosmic_and_clinvar_edge_shapes(self):
+        """Test field-map parsing of list values, nested objects, and non-dict items."""
+        client = MyVariantClient()
+
+        clinvar = client._parse_clinvar_evidence(
+            [
+                {
+                    "clinical_significance": ["Pathogenic", "Likely pathogenic"],
+                    "conditions": {"name": "Melanoma"},
+                    "variation_id": 13961,
+                },
+                "not-a-dict",
+            ]
+        )
+        assert len(clinvar) == 1
+        assert clinvar[0].clinical_significance == "Pathogenic, Likely pathogenic"
+        assert clinvar[0].conditions == ["Melanoma"]
+        assert clinvar[0].variation_id == "13961"
+
+        cosmic = client._parse_cosmic_evidence({"primary_site": "skin", "sample_count": 12})
+        assert cosmic[0].primary_site == "skin"
+        assert cosmic[0].sample_count == 12
+        assert cosmic[0].mutation_id is None
+
+    def test_parsers_enforce_declared_types(self):
+        """Test that unvalidated parsing still yields the models' declared types."""
+        from tumorboard.models.evidence import Evidence
+
+        client = MyVariantClient()
+
+        civic = client._parse_civic_evidence(
+            {"drugs": ["Vemurafenib", 42, None, {"name": "x"}], "rating": "4", "disease": {}}
+        )
+        assert civic[0].drugs == ["Vemurafenib", "42"]
+        assert civic[0].rating == 4
+        assert civic[0].disease is None
+
+        cosmic = client._parse_cosmic_evidence({"mutation_id": 476, "sample_count": "n/a"})
+        assert cosmic[0].mutation_id == "476"
+        assert cosmic[0].sample_count is None
+
+        evidence = Evidence(variant_id="x", gene="BRAF", variant="V600E", civic=civic)
+        assert "Drugs: Vemurafenib, 42" in evidence.summary()
+
+    @pytest.mark.asyncio
+    async def test_fetch_evidence_classifies_hgvs(self):
+        """Test genomic, protein, and transcript HGVS extraction."""
+        client = MyVariantClient()
+
+        mock_response = {
+            "total": 1,
+            "hits": [
+                {
+                    "_id": "chr7:g.140453136A>T",
+                    "hgvs": [
+                        "NM_004333.4:c.1799T>A",
+                        "NP_004324.2:p.Val600Glu",
+                        "NM_001354609.1:c.1799T>A",
+                        "NC_000007.13:g.140453136A>T",
+                    ],
+                }
+            ],
+        }
+
+        with patch.object(client, "_query", new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = mock_response
+
+            evidence = await client.fetch_evidence("BRAF", "V600E")
+
+            assert evidence.hgvs_genomic == "NC_000007.13:g.140453136A>T"
+            assert evidence.hgvs_protein == "NP_004324.2:p.Val600Glu"
+            assert evidence.hgvs_transcript == "NM_004333.4:c.1799T>A"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_query_concurrency_limit(self, mock_http):
+        """Test that in-flight requests never exceed max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"total": 0, "hits": []})
+
+        client = MyVariantClient(cache_dir=None, max_concurrency=2)
+        with mock_http(client, handler):
+            await asyncio.gather(*(client._query(f"BRAF V60{i}E") for i in range(6)))
+
+        assert peak == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_evidence_keeps_raw_source_fields(self):
+        """Test that source parsers see fields not modelled on MyVariantHit."""
+        client = MyVariantClient()
+
+        mock_response = {
+            "total": 1,
+            "hits": [
+                {
+                    "_id": "chr7:g.140453136A>T",
+                    "clinvar": {"variant_id": 13961, "review_status": "reviewed by expert panel"},
+                    "cosmic": {"cosmic_id": "COSM476", "primary_site": "skin"},
+                }
+            ],
+        }
+
+        with patch.object(client, "_query", new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = mock_response
+
+            evidence = await client.fetch_evidence("BRAF", "V600E")
+
+            assert evidence.clinvar[0].review_status == "reviewed by expert panel"
+            assert evidence.cosmic[0].primary_site == "skin"
+            assert evidence.raw_data["_id"] == "chr7:g.140453136A>T"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_warms_shared_pool_once(self, no_pool_warmup_requests):
+        """Test that the pool is warmed in the background once and keepalive stops on shutdown."""
+        from tumorboard.api import myvariant
+
+        await shutdown_shared_client()
+
+        async with MyVariantClient():
+            # Entry does not wait for the warm-up ping
+            no_pool_warmup_requests.assert_not_awaited()
+        async with MyVariantClient():
+            pass
+
+        await asyncio.sleep(0)
+        no_pool_warmup_requests.assert_awaited_once()
+        loop_tasks = myvariant._keepalive_tasks[asyncio.get_running_loop()]
+        keepalive = next(iter(loop_tasks.values()))
+
+        await shutdown_shared_client()
+        assert keepalive.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_survives_failed_pings(self, no_pool_warmup_requests):
+        """Test that keepalive outlives 5xx and connection errors and stops once closed."""
+        from tumorboard.api import myvariant
+
+        # The autouse fixture stubs _ping; exercise the real one here
+        no_pool_warmup_requests.side_effect = _ping
+        handler = MagicMock(side_effect=[httpx.Response(500), httpx.ConnectError("refused")])
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        sleeps = 0
+
+        async def fake_sleep(delay):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps == 2:
+                await http_client.aclose()
+
+        with patch.object(myvariant.asyncio, "sleep", side_effect=fake_sleep):
+            task = asyncio.create_task(_keepalive(http_client, MyVariantClient.BASE_URL))
+            await asyncio.wait_for(task, timeout=1)
+
+        assert task.exception() is None
+        assert handler.call_count == 2
+        assert sleeps == 2
+
+    @pytest.mark.asyncio
+    async def test_context_manager_without_warm_pool(self, no_pool_warmup_requests):
+        """Test that warm_pool=False skips the warm-up and keepalive task."""
+        from tumorboard.api import myvariant
+
+        await shutdown_shared_client()
+
+        async with MyVariantClient(warm_pool=False) as client:
+            assert client._client is not None
+
+        await asyncio.sleep(0)
+        no_pool_warmup_requests.assert_not_awaited()
+        assert not myvariant._keepalive_tasks.get(asyncio.get_running_loop())
+        await shutdown_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_negative_lookup_cached_with_short_ttl(self):
+        """Test that lookups without hits are served from cache with a shorter TTL."""
+        from tumorboard.api import myvariant
+
+        client = MyVariantClient()
+
+        with patch.object(client, "_query", new_callable=AsyncMock) as mock_query:
+            mock_query.return_value = {"total": 0, "hits": []}
+
+            first = await client.fetch_evidence("UNKNOWN", "X123Y")
+            second = await client.fetch_evidence("UNKNOWN", "X123Y")
+
+            assert mock_query.await_count == 3
+            assert first is second
+            assert not first.has_evidence()
+
+        expires_at, _ = myvariant._evidence_cache._data[("UNKNOWN", "X123Y")]
+        assert expires_at - time.monotonic() <= myvariant.EVIDENCE_NEGATIVE_CACHE_TTL
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_large_response_parsed_off_event_loop(self, mock_http):
+        """Test that only bodies above the threshold are decoded in a thread."""
+        from tumorboard.api import myvariant
+
+        small = {"total": 0, "hits": []}
+        large = {"total": 1, "hits": [{"_id": "x" * (myvariant.THREADED_PARSE_THRESHOLD + 1)}]}
+        payloads = iter([small, large])
+        handler = MagicMock(side_effect=lambda request: httpx.Response(200, json=next(payloads)))
+
+        client = MyVariantClient(cache_dir=None)
+        with (
+            mock_http(client, handler),
+            patch.object(myvariant.asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread,
+        ):
+            assert await client._query("small") == small
+            to_thread.assert_not_called()
+
+            assert await client._query("large") == large
+            to_thread.assert_called_once()
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_query_retries_transient_errors(self, mock_http):
+        """Test that 503 responses are retried until success or max_retries."""
+        from tumorboard.api import myvariant
+
+        statuses = iter([503, 503, 200])
+        handler = MagicMock(
+            side_effect=lambda request: httpx.Response(next(statuses), json={"total": 0})
+        )
+
+        client = MyVariantClient(cache_dir=None, max_retries=3)
+        with (
+            mock_http(client, handler),
+            patch.object(myvariant.asyncio, "sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            assert await client._query("BRAF p.V600E") == {"total": 0}
+
+        assert handler.call_count == 3
+        assert mock_sleep.await_count == 2
+        await client.close()
@@ -6,7 +6,7 @@ from pydantic import ValidationError
 from tumorboard.models.assessment import ActionabilityAssessment, ActionabilityTier, RecommendedTherapy
 from tumorboard.models.evidence import CIViCEvidence, Evidence
 from tumorboard.models.validation import GoldStandardEntry, ValidationMetrics, ValidationResult
-from tumorboard.models.variant import VariantInput
+from tumorboard.models.variant import Variant, VariantInput
 
 
 class TestVariantInput:
@@ -27,6 +27,17 @@ class TestVariantInput:
         """Test HGVS conversion."""
         variant = VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma")
         assert variant.to_hgvs() == "BRAF:V600E"
+        assert variant.model_copy(update={"gene": "KRAS"}).to_hgvs() == "KRAS:V600E"
+
+    def test_variant_input_frozen_and_hashable(self):
+        """Test that variant inputs are immutable and usable as dict keys."""
+        variant = VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma")
+
+        with pytest.raises(ValidationError):
+            variant.gene = "KRAS"
+
+        same = VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma")
+        assert {variant: "cached"}[same] == "cached"
 
     def test_variant_input_without_tumor(self):
         """Test creating a variant input without tumor type."""
@@ -40,6 +51,28 @@ class TestVariantInput:
         assert variant.tumor_type is None
 
 
+class TestVariant:
+    """Tests for the internal Variant dataclass."""
+
+    def test_round_trip_with_variant_input(self):
+        """Test converting between the API model and the internal dataclass."""
+        api_variant = VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma")
+
+        variant = Variant.from_api(api_variant)
+
+        assert variant == Variant("BRAF", "V600E", "Melanoma")
+        assert variant.to_hgvs() == "BRAF:V600E"
+        assert variant.to_api() == api_variant
+
+    def test_variant_is_slotted_and_frozen(self):
+        """Test that Variant carries no per-instance dict and cannot be mutated."""
+        variant = Variant(gene="KRAS", variant="G12C")
+
+        assert not hasattr(variant, "__dict__")
+        with pytest.raises(AttributeError):
+            variant.gene = "NRAS"
+
+
 class TestEvidence:
     """Tests for Evidence models."""
 
@@ -0,0 +1,109 @@
+"""Tests for utility helpers."""
+
+import sqlite3
+import threading
+from unittest.mock import patch
+
+from tumorboard.utils.cache import SQLiteCache, TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted at capacity."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire(self):
+        """Test default and per-entry TTLs."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+
+        with patch("tumorboard.utils.cache.time.monotonic", return_value=0.0):
+            cache.set("long", 1)
+            cache.set("short", 2, ttl=5)
+
+        with patch("tumorboard.utils.cache.time.monotonic", return_value=10.0):
+            assert cache.get("long") == 1
+            assert cache.get("short") is None
+
+        with patch("tumorboard.utils.cache.time.monotonic", return_value=61.0):
+            assert cache.get("long") is None
+
+
+class TestSQLiteCache:
+    """Tests for SQLiteCache."""
+
+    @staticmethod
+    def _stored_keys(cache: SQLiteCache) -> set[str]:
+        with sqlite3.connect(cache.directory / cache.FILENAME) as conn:
+            return {row[0] for row in conn.execute("SELECT key FROM cache")}
+
+    def test_purges_expired_rows_on_open_and_periodically(self, tmp_path):
+        """Test that expired rows are purged at open and every PURGE_INTERVAL writes."""
+        cache = SQLiteCache(tmp_path)
+        cache.PURGE_INTERVAL = 3
+        with patch("tumorboard.utils.cache.time.time", return_value=0.0):
+            cache.set("stale", {"v": 1}, expire=1)
+            cache.set("fresh", {"v": 2}, expire=100)
+
+        with patch("tumorboard.utils.cache.time.time", return_value=10.0):
+            assert cache.get("stale") is None
+            # Expired but not yet purged between intervals
+            assert self._stored_keys(cache) == {"stale", "fresh"}
+            cache.set("third", {"v": 3}, expire=100)
+            assert self._stored_keys(cache) == {"fresh", "third"}
+        cache.close()
+
+        with patch("tumorboard.utils.cache.time.time", return_value=0.0):
+            cache.set("stale", {"v": 1}, expire=1)
+        cache.close()
+
+        reopened = SQLiteCache(tmp_path)
+        with patch("tumorboard.utils.cache.time.time", return_value=10.0):
+            assert reopened.get("fresh") == {"v": 2}
+        assert self._stored_keys(reopened) == {"fresh", "third"}
+        reopened.close()
+
+    def test_usable_from_other_threads(self, tmp_path):
+        """Test that a connection opened on one thread works from another."""
+        cache = SQLiteCache(tmp_path)
+        cache.set("key", [1, 2], expire=60)
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(cache.get("key")))
+        thread.start()
+        thread.join()
+
+        assert results == [[1, 2]]
+        cache.close()
+
+    def test_unusable_directory_is_a_miss(self, tmp_path):
+        """Test that a cache directory that cannot be created degrades to misses."""
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("")
+        cache = SQLiteCache(not_a_dir / "cache")
+
+        cache.set("key", {"v": 1}, expire=60)
+        assert cache.get("key") is None
+        cache.close()
+
+    def test_purge_caps_entry_count(self, tmp_path):
+        """Test that purges keep only the max_entries latest-expiring rows."""
+        cache = SQLiteCache(tmp_path, max_entries=2)
+        cache.PURGE_INTERVAL = 3
+        cache.set("a", 1, expire=10)
+        cache.set("b", 2, expire=30)
+        cache.set("c", 3, expire=20)
+
+        assert self._stored_keys(cache) == {"b", "c"}
+        cache.close()